@@ -44,6 +44,16 @@ class Property[T](GObject.Property):
             | (GObject.BindingFlags.BIDIRECTIONAL if bidirectional else 0),
         )
 
+    @staticmethod
+    def set_if_changed(obj: GObject.Object, name: str, value: Any, /):  # noqa: ANN401
+        """Set the property `name` of `obj` to `value` only if it differs.
+
+        Unlike a regular assignment, this doesn't emit `GObject.Object::notify`
+        for values that stay the same.
+        """
+        if obj.get_property(name) != value:
+            obj.set_property(name, value)
+
     @staticmethod
     def bind_setting(
         settings: Gio.Settings,
@@ -51,11 +61,17 @@ class Property[T](GObject.Property):
         target: GObject.Object,
         target_property: str | None = None,
         /,
+        *,
+        get_only: bool = False,
     ):
         """Create setting bindings more conveniently.
 
         An empty `target_property` is assumed to be the same as `key`.
+        If `get_only` is set, changes to `target` are not written back to `settings`.
         """
         settings.bind(
-            key, target, target_property or key, Gio.SettingsBindFlags.DEFAULT
+            key,
+            target,
+            target_property or key,
+            Gio.SettingsBindFlags.GET if get_only else Gio.SettingsBindFlags.DEFAULT,
         )
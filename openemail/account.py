@@ -8,8 +8,6 @@ from dataclasses import fields
 from shutil import rmtree
 from typing import Any
 
-import keyring
-
 import openemail as app
 
 from . import core, store, tasks
@@ -93,7 +91,7 @@ def log_out():
     ):
         store.settings.reset(key)
 
-    keyring.delete_password(store.secret_service, client.user.address)
+    store.secret_delete(client.user.address)
 
     for directory in core.cache_dir, core.data_dir:
         rmtree(directory, ignore_errors=True)
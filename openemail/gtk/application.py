@@ -3,17 +3,17 @@
 # SPDX-FileCopyrightText: Copyright 2025 OpenEmail SA
 # SPDX-FileContributor: kramo
 
+import asyncio
 import json
 from collections.abc import Generator
 from contextlib import suppress
 from datetime import UTC, date, datetime
 from typing import override
 
-import keyring
 from gi.repository import Adw
 
 import openemail as app
-from openemail import APP_ID, PREFIX, store
+from openemail import APP_ID, PREFIX, store, tasks
 from openemail.core import client
 from openemail.core.crypto import KeyPair
 from openemail.core.model import Address
@@ -46,7 +46,7 @@ class Application(Adw.Application):
 
         if (
             (address := store.settings.get_string("address"))
-            and (keys := keyring.get_password(store.secret_service, address))
+            and (keys := store.secret_get(address))
             and (keys := json.loads(keys))
             and (encryption_key := keys.get("privateEncryptionKey"))
             and (signing_key := keys.get("privateSigningKey"))
@@ -79,13 +79,19 @@ class Application(Adw.Application):
         # and optionally an email or URL.
         about.props.translator_credits = _("translator-credits")
 
-        app.log_path.parent.mkdir(parents=True, exist_ok=True)
-        app.log_path.touch(exist_ok=True)
-        about.props.debug_info = app.log_path.read_text()
         about.props.debug_info_filename = app.log_path.name
-
         about.present(self.props.active_window)
 
+        tasks.create(self._load_debug_info(about))
+
+    @staticmethod
+    async def _load_debug_info(about: Adw.AboutDialog):
+        app.log_path.parent.mkdir(parents=True, exist_ok=True)
+        app.log_path.touch(exist_ok=True)
+        about.props.debug_info = await asyncio.get_running_loop().run_in_executor(
+            None, app.log_path.read_text
+        )
+
     def _quit(self):
         if win := self.props.active_window:
             win.close()
@@ -93,7 +99,7 @@ class Application(Adw.Application):
     @staticmethod
     def _get_expired_trash_items(interval: int) -> Generator[str]:
         today = datetime.now(UTC).date()
-        for msg in store.settings.get_strv("trashed-messages"):
+        for msg in store.settings_get("trashed-messages"):
             ident, timestamp = msg.rsplit(maxsplit=1)
             with suppress(ValueError):
                 if (today - date.fromisoformat(timestamp)).days >= interval:
@@ -35,6 +35,8 @@ class Body(Gtk.TextView):
 
     summary = Property(bool)
 
+    _edited_handler: int | None = None
+
     @Property(str)
     def text(self) -> str | None:
         """The message's formatted body."""
@@ -122,9 +124,13 @@ class Body(Gtk.TextView):
 
     def _on_editable_changed(self, *_args):
         if self.get_editable():
-            self.props.buffer.connect("changed", self._on_edited)
-        else:
-            self.props.buffer.disconnect_by_func(self._on_edited)
+            if self._edited_handler is None:
+                self._edited_handler = self.props.buffer.connect(
+                    "changed", self._on_edited
+                )
+        elif self._edited_handler is not None:
+            self.props.buffer.disconnect(self._edited_handler)
+            self._edited_handler = None
 
     def _on_edited(self, *_args):
         self.text = self.props.buffer.props.text
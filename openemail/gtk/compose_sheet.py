@@ -104,7 +104,7 @@ class ComposeSheet(Adw.BreakpointBin):
             return
 
         def complete(*_args):
-            readers.disconnect_by_func(complete)
+            readers.disconnect(handler)
 
             pos = readers.props.cursor_position
             start = re.split(ADDRESS_SPLIT_PATTERN, readers.props.text[:pos])[-1]
@@ -125,7 +125,7 @@ class ComposeSheet(Adw.BreakpointBin):
                 readers.select_region(pos, pos + len(end))
                 break
 
-        readers.connect("changed", complete)
+        handler = readers.connect("changed", complete)
 
     @Gtk.Template.Callback()
     def _send_message(self, *_args):
@@ -54,14 +54,16 @@ class ContactRow(Gtk.Box):
     @Gtk.Template.Callback()
     def _accept(self, *_args):
         address = self.profile.value_of("address")
-        store.settings_discard("contact-requests", address)
+        store.settings_discard_batched("contact-requests", address)
 
         with suppress(ValueError):
             tasks.create(store.address_book.new(address))
 
     @Gtk.Template.Callback()
     def _decline(self, *_args):
-        store.settings_discard("contact-requests", self.profile.value_of("address"))
+        store.settings_discard_batched(
+            "contact-requests", self.profile.value_of("address")
+        )
 
     @Gtk.Template.Callback()
     def _show_context_menu(self, _gesture, _n_press: int, x: float, y: float):
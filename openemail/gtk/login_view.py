@@ -5,11 +5,10 @@
 
 import json
 
-import keyring
 from gi.repository import Adw, GLib, GObject, Gtk
 
 import openemail as app
-from openemail import APP_ID, PREFIX, Property, account, store, tasks
+from openemail import PREFIX, Property, account, store, tasks
 from openemail.core import client
 from openemail.core.crypto import KeyPair
 from openemail.core.model import Address
@@ -98,14 +97,20 @@ class LoginView(Adw.Bin):
     def _authenticated(self):
         self.button_child_name = self.register_button_child_name = "label"
 
-        store.settings.set_string("address", client.user.address)
-        keyring.set_password(
-            f"{APP_ID}.Keys",
-            client.user.address,
-            json.dumps({
-                "privateEncryptionKey": str(client.user.encryption_keys.private),
-                "privateSigningKey": str(client.user.signing_keys),
-            }),
+        user = client.user
+
+        if store.settings.get_string("address") != user.address:
+            store.settings.set_string("address", user.address)
+
+        store.secret_set(
+            user.address,
+            json.dumps(
+                {
+                    "privateEncryptionKey": str(user.encryption_keys.private),
+                    "privateSigningKey": str(user.signing_keys),
+                },
+                separators=(",", ":"),
+            ),
         )
 
         tasks.create(store.sync())
@@ -92,7 +92,9 @@ class _Messages(Adw.NavigationPage):
         self.page: Page = self._get_object("page")
         self.page.title = self.props.title = title
         self.page.subtitle = subtitle
-        self.page.model.connect("notify::selected", self._on_selected)
+        self._selected_handler = self.page.model.connect(
+            "notify::selected", self._on_selected
+        )
 
         self.props.child = self.page
 
@@ -200,7 +202,9 @@ class Drafts(_Messages):
 
     def _on_selected(self, selection: Gtk.SingleSelection, *_args):
         if isinstance(msg := selection.props.selected_item, Message):
-            selection.unselect_all()
+            with selection.handler_block(self._selected_handler):
+                selection.unselect_all()
+
             self.activate_action(
                 "compose.draft", GLib.Variant.new_string(msg.unique_id)
             )
@@ -112,7 +112,7 @@ class Preferences(Adw.PreferencesDialog):
         while self._domain_rows:
             self.domains.remove(self._domain_rows.pop())
 
-        for domain in store.settings.get_strv("trusted-domains"):
+        for domain in store.settings_get("trusted-domains"):
             remove_button = Gtk.Button(
                 icon_name="edit-delete-symbolic",
                 tooltip_text=_("Remove"),
@@ -3,21 +3,39 @@
 # SPDX-FileCopyrightText: Copyright 2025 OpenEmail SA
 # SPDX-FileContributor: kramo
 
-from collections.abc import Awaitable, Callable
 from contextlib import suppress
-from typing import Any, cast
+from dataclasses import fields
+from typing import TYPE_CHECKING, Any, cast
 
 from gi.repository import Adw, Gdk, GdkPixbuf, Gio, GLib, Gtk
 
 from openemail import PREFIX, Property, profile, tasks
-from openemail.core import client
+from openemail.core import client, model
 from openemail.core.model import WriteError
 from openemail.profile import Profile, ProfileField
 
 from .form import Form
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+
 child = Gtk.Template.Child()
 
+bool_fields = frozenset(
+    field.name.replace("_", "-")
+    for field in fields(model.Profile)
+    if field.type is bool
+)
+
+image_filter = Gtk.FileFilter(
+    name=_("Images"),
+    mime_types=tuple({
+        mime_type
+        for pixbuf_format in GdkPixbuf.Pixbuf.get_formats()
+        for mime_type in (pixbuf_format.get_mime_types() or ())
+    }),
+)
+
 
 @Gtk.Template.from_resource(f"{PREFIX}/profile-settings.ui")
 class ProfileSettings(Adw.PreferencesDialog):
@@ -38,7 +56,8 @@ class ProfileSettings(Adw.PreferencesDialog):
     visible_child_name = Property(str, default="loading")
 
     _pages: list[Adw.PreferencesPage]
-    _fields: dict[str, Callable[[], str]]
+    _entries: dict[str, Adw.EntryRow]
+    _switches: dict[str, Adw.SwitchRow]
     _changed: bool = False
 
     _profile: Profile | None = None
@@ -50,58 +69,74 @@ class ProfileSettings(Adw.PreferencesDialog):
 
     @profile.setter
     def profile(self, profile: Profile | None):
-        self._profile = profile
+        # The profile is always unset while updating, so an identical one is a no-op
+        if profile is self._profile:
+            return
 
-        while self._pages:
-            self.remove(self._pages.pop())
+        with self.freeze_notify():
+            self._profile = profile
 
-        if not profile:
-            self.visible_child_name = "loading"
-            self._changed = False
-            return
+            if not profile:
+                for page in self._pages:
+                    self.remove(page)
+
+                Property.set_if_changed(self, "visible-child-name", "loading")
+                self._changed = False
+                return
+
+            self.address = profile.value_of("address") or ""
+            self.name.props.text = profile.value_of("name")
+            self.away.props.enable_expansion = profile.value_of("away")
+            self.away.props.expanded = self.away.props.enable_expansion
+            self.away_warning.props.text = profile.value_of("away-warning") or ""
+
+            if not self._pages:
+                self._create_pages()
+
+            for field in Profile.fields:
+                value = profile.value_of(field.ident)
+
+                if row := self._switches.get(field.ident):
+                    row.props.active = bool(value)
+                elif entry := self._entries.get(field.ident):
+                    entry.props.text = str(value or "")
+
+            for page in self._pages:
+                self.add(page)
 
-        self.address = profile.value_of("address") or ""
-        self.name.props.text = profile.value_of("name")
-        self.away.props.enable_expansion = profile.value_of("away")
-        self.away.props.expanded = self.away.props.enable_expansion
-        self.away_warning.props.text = profile.value_of("away-warning") or ""
-        self.status.props.text = profile.value_of("status") or ""
-        self.about.props.text = profile.value_of("about") or ""
+            Property.set_if_changed(self, "visible-child-name", "profile")
+            self._changed = False
 
+    def _create_pages(self):
         for category in Profile.categories:
             if category.ident == "general":  # Already added manually
                 continue
 
             page = Adw.PreferencesPage(
                 title=category.name,
-                icon_name=f"{category.ident}-symbolic",
+                icon_name=category.icon_name,
             )
 
-            group = Adw.PreferencesGroup()
-            group.bind_model(category, self._create_row, profile)  # pyright: ignore[reportAttributeAccessIssue]
-            page.add(group)
+            page.add(group := Adw.PreferencesGroup())
+            for field in category.fields:
+                group.add(self._create_row(field))
 
             self._pages.append(page)
-            self.add(page)
-
-        self.visible_child_name = "profile"
-        self._changed = False
 
-    def _create_row(self, field: ProfileField, profile: Profile) -> Gtk.Widget:
-        value = profile.value_of(field.ident)
-
-        if isinstance(value, bool):
-            row = Adw.SwitchRow(active=value)
+    def _create_row(self, field: ProfileField) -> Gtk.Widget:
+        # Not based on values, since those are all missing if fetching failed
+        if field.ident in bool_fields:
+            row = Adw.SwitchRow()
             row.connect("notify::active", self._on_change)
-            self._fields[field.ident] = lambda r=row: "Yes" if r.props.active else "No"
+            self._switches[field.ident] = row
         else:
-            row = Adw.EntryRow(text=str(value or ""))
+            row = Adw.EntryRow()
             row.add_css_class("property")
             row.connect("changed", self._on_change)
-            self._fields[field.ident] = row.get_text
+            self._entries[field.ident] = row
 
         row.props.title = field.name
-        row.add_prefix(Gtk.Image.new_from_icon_name(f"{field.ident}-symbolic"))
+        row.add_prefix(Gtk.Image.new_from_icon_name(field.icon_name))
 
         return row
 
@@ -109,13 +144,13 @@ class ProfileSettings(Adw.PreferencesDialog):
         super().__init__(**kwargs)
 
         self._pages = []
-        self._fields = {
-            "name": self.name.get_text,
-            "away": lambda: "Yes" if self.away.props.enable_expansion else "No",
-            "away-warning": self.away_warning.get_text,
-            "status": self.status.get_text,
-            "about": self.about.get_text,
+        self._entries = {
+            "name": self.name,
+            "away-warning": self.away_warning,
+            "status": self.status,
+            "about": self.about,
         }
+        self._switches = {}
 
         Profile.of(client.user).connect(
             "notify::updating",
@@ -128,10 +163,10 @@ class ProfileSettings(Adw.PreferencesDialog):
 
     @Gtk.Template.Callback()
     def _delete_image(self, *_args):
-        self.pending = True
+        Property.set_if_changed(self, "pending", True)
         tasks.create(
             profile.delete_image(),
-            lambda _: self.set_property("pending", False),
+            lambda _: Property.set_if_changed(self, "pending", False),
         )
 
     @Gtk.Template.Callback()
@@ -147,7 +182,16 @@ class ProfileSettings(Adw.PreferencesDialog):
             self.away_warning.props.text = ""
 
         self._changed = False
-        tasks.create(profile.update({key: f() for key, f in self._fields.items()}))
+        tasks.create(
+            profile.update({
+                **{key: row.props.text for key, row in self._entries.items()},
+                **{
+                    key: "Yes" if row.props.active else "No"
+                    for key, row in self._switches.items()
+                },
+                "away": "Yes" if self.away.props.enable_expansion else "No",
+            })
+        )
 
     @tasks.callback
     async def _replace_image(self, *_args):
@@ -156,33 +200,18 @@ class ProfileSettings(Adw.PreferencesDialog):
                 "Awaitable[Gio.File]",
                 Gtk.FileDialog(
                     initial_name=_("Select an Image"),
-                    default_filter=Gtk.FileFilter(
-                        name=_("Images"),
-                        mime_types=tuple(
-                            mime_type
-                            for pixbuf_format in GdkPixbuf.Pixbuf.get_formats()
-                            for mime_type in (pixbuf_format.get_mime_types() or ())
-                        ),
-                    ),
+                    default_filter=image_filter,
                 ).open(win if isinstance(win := self.props.root, Gtk.Window) else None),
             )
         except GLib.Error:
             return
 
-        if not (file and (path := file.get_path())):
-            return
-
-        try:
-            pixbuf = GdkPixbuf.Pixbuf.new_from_file(path)
-        except GLib.Error:
-            return
-
-        if not pixbuf:
+        if not file:
             return
 
-        self.pending = True
+        Property.set_if_changed(self, "pending", True)
 
         with suppress(WriteError):
-            await profile.update_image(pixbuf)
+            await profile.update_image(file)
 
-        self.pending = False
+        Property.set_if_changed(self, "pending", False)
@@ -19,7 +19,8 @@ class ProfileView(Adw.Bin):
 
     __gtype_name__ = __qualname__
 
-    _groups: list[Adw.PreferencesGroup]
+    _groups: dict[str, Adw.PreferencesGroup]
+    _rows: dict[str, Adw.ActionRow]
 
     page: Adw.PreferencesPage = child
 
@@ -44,57 +45,79 @@ class ProfileView(Adw.Bin):
 
     @profile.setter
     def profile(self, profile: Profile | None):
-        self._profile = profile
+        with self.freeze_notify():
+            self._profile = profile
 
-        if not profile:
-            self.visible_child_name = "empty"
-            return
+            if not profile:
+                Property.set_if_changed(self, "visible-child-name", "empty")
+                return
 
-        self.is_contact = profile in store.address_book if profile.address else False
+            self.is_contact = profile.address in store.address_book
 
-        if not profile.value_of("address"):
-            self.visible_child_name = "not-found"
-            return
+            if not profile.value_of("address"):
+                Property.set_if_changed(self, "visible-child-name", "not-found")
+                return
 
-        self.name = profile.value_of("name")
-        self.address = profile.value_of("address") or ""
-        self.away = profile.value_of("away") or False
+            self.name = profile.value_of("name")
+            self.address = profile.value_of("address") or ""
+            self.away = profile.value_of("away") or False
 
-        while self._groups:
-            self.page.remove(self._groups.pop())
+            values = {
+                field.ident: profile.value_of(field.ident) for field in Profile.fields
+            }
 
-        self._groups = []
+            with self.page.freeze_notify():
+                if not self._groups:
+                    self._create_groups()
 
-        def _filter_empty_fields(field: ProfileField) -> bool:
-            return bool(profile.value_of(field.ident))
+                for category in Profile.categories:
+                    if not (group := self._groups.get(category.ident)):
+                        continue
 
-        empty_fields_filter = Gtk.CustomFilter.new(_filter_empty_fields)
-        for category in Profile.categories:
-            if category.ident == "configuration":  # Only relevant for settings
-                continue
+                    visible = any(values[field.ident] for field in category.fields)
+                    Property.set_if_changed(group, "visible", visible)
 
-            if not (filtered := Gtk.FilterListModel.new(category, empty_fields_filter)):
-                continue
+                    if not visible:
+                        continue
 
-            group = Adw.PreferencesGroup(title=category.name, separate_rows=True)
-            group.bind_model(filtered, self._create_row, profile)  # pyright: ignore[reportAttributeAccessIssue]
-            self._groups.append(group)
-            self.page.add(group)
+                    for field in category.fields:
+                        row = self._rows[field.ident]
+                        value = values[field.ident]
+                        Property.set_if_changed(row, "visible", bool(value))
+                        Property.set_if_changed(row, "subtitle", str(value or ""))
+
+            self._bind_broadcasts(profile)
 
-        if self._broadcasts_binding:
-            self._broadcasts_binding.unbind()
+            Property.set_if_changed(self, "visible-child-name", "profile")
+
+    def _bind_broadcasts(self, profile: Profile):
+        if binding := self._broadcasts_binding:
+            if binding.props.source is profile:
+                return
+
+            binding.unbind()
 
         self._broadcasts_binding = Property.bind(
             profile, "receive-broadcasts", self, "broadcasts", bidirectional=True
         )
 
-        self.visible_child_name = "profile"
+    def _create_groups(self):
+        for category in Profile.categories:
+            if category.ident == "configuration":  # Only relevant for settings
+                continue
+
+            group = Adw.PreferencesGroup(title=category.name, separate_rows=True)
+            for field in category.fields:
+                group.add(row := self._create_row(field))
+                self._rows[field.ident] = row
+
+            self._groups[category.ident] = group
+            self.page.add(group)
 
     @staticmethod
-    def _create_row(field: ProfileField, profile: Profile) -> Gtk.Widget:
+    def _create_row(field: ProfileField) -> Adw.ActionRow:
         row = Adw.ActionRow(
             title=field.name,
-            subtitle=profile.value_of(field.ident),
             subtitle_selectable=True,
             use_markup=False,
         )
@@ -102,7 +125,7 @@ class ProfileView(Adw.Bin):
         row.add_prefix(
             Gtk.Image(
                 valign=Gtk.Align.START,
-                icon_name=f"{field.ident}-symbolic",
+                icon_name=field.icon_name,
                 margin_top=18,
             )
         )
@@ -111,7 +134,8 @@ class ProfileView(Adw.Bin):
     def __init__(self, **kwargs: Any):
         super().__init__(**kwargs)
 
-        self._groups = []
+        self._groups = {}
+        self._rows = {}
 
     @Gtk.Template.Callback()
     def _remove_contact(self, *_args):
@@ -37,8 +37,8 @@ class MessageView(Gtk.Box):
 
     __gtype_name__ = __qualname__
 
-    profile_dialog: Adw.Dialog = child
-    profile_view: ProfileView = child
+    _profile_dialog: Adw.Dialog
+    _profile_view: ProfileView | None = None
 
     @Property(Message)
     def message(self) -> Message:
@@ -56,8 +56,12 @@ class MessageView(Gtk.Box):
 
     @Gtk.Template.Callback()
     def _show_profile_dialog(self, *_args):
-        self.profile_view.profile = self.message.profile
-        self.profile_dialog.present(self)
+        if not (view := self._profile_view):
+            view = self._profile_view = ProfileView()
+            self._profile_dialog = Adw.Dialog(content_width=400, child=view)
+
+        view.profile = self.message.profile
+        self._profile_dialog.present(self)
 
 
 @Gtk.Template.from_resource(f"{PREFIX}/thread-view.ui")
@@ -72,66 +76,87 @@ class ThreadView(Adw.Bin):
 
     app_icon_name = Property(str, default=f"{APP_ID}-symbolic")
     message = Property[Message | None](Message)
-    subject_id = Property(str)
-    model = Property(
-        Gio.ListModel,
-        default=store.flatten(
-            store.inbox,
-            store.outbox,
-            store.broadcasts,
-            Gtk.FilterListModel.new(store.sent, store.outbox.filter),
-        ),
-    )
+    model = Property(Gio.ListStore)
 
     def __init__(self, **kwargs: Any):
         super().__init__(**kwargs)
 
-        self.box.set_header_func(
-            lambda row, before: row.set_header(
-                Gtk.Separator(
-                    margin_top=6,
-                    margin_bottom=6,
-                    margin_start=18,
-                    margin_end=18,
-                )
-                if before
-                else None
-            )
-        )
+        self.model = Gio.ListStore.new(Message)
+
+        self.box.set_header_func(self._update_header)
 
-        self._rows = dict[Message, Gtk.ListBoxRow]()
+        self._rows = dict[str, Gtk.ListBoxRow]()
         self.box.bind_model(self.sort_model, self._create_widget)
 
+        for messages in store.inbox, store.outbox, store.broadcasts, store.sent:
+            messages.connect("items-changed", self._update_thread)
+
         self.connect("notify::message", self._on_message_changed)
         self.notify("message")
 
     def _on_message_changed(self, *_args):
-        if not self.message:
-            self._rows.clear()
-
-        self.subject_id = (
-            # "No ID" here is not proper, but I'm not sure what would be better.
-            # This needs to be done because the default behavior of StringFilter is to
-            # allow everything on ""/null instead of denying and you can't change this.
-            msg.subject_id if (msg := self.message) and msg.subject_id else "No ID"
-        )
+        msg = self.message
+        self._update_thread()
 
         (self.add_css_class if msg else self.remove_css_class)("view")
         (self.box.remove_css_class if msg else self.box.add_css_class)("background")
 
-        if self.message and (len(self.sort_model) > 1):
-            GLib.timeout_add(100, self._scroll_to, self.message)
+        if msg and (len(self.sort_model) > 1):
+            GLib.idle_add(self._scroll_to, msg, priority=GLib.PRIORITY_LOW)
+
+    def _update_thread(self, *_args):
+        # Equal messages from different stores are separate objects, diff by identity
+        thread = (
+            {id(m): m for m in store.thread(msg.subject_id)}
+            if (msg := self.message) and msg.subject_id
+            else {}
+        )
+
+        if thread.keys() == (current := {id(m): m for m in self.model}).keys():
+            return
+
+        for pos in reversed(range(len(self.model))):
+            if id(self.model[pos]) not in thread:
+                self.model.remove(pos)
+
+        idents = {m.unique_id for m in thread.values()}
+        self._rows = {
+            ident: row for ident, row in self._rows.items() if ident in idents
+        }
+        self.model.splice(
+            len(self.model),
+            0,
+            tuple(m for key, m in thread.items() if key not in current),
+        )
+
+    @staticmethod
+    def _update_header(row: Gtk.ListBoxRow, before: Gtk.ListBoxRow | None):
+        if not before:
+            row.set_header(None)
+            return
+
+        if not row.get_header():
+            row.set_header(
+                Gtk.Separator(
+                    margin_top=6,
+                    margin_bottom=6,
+                    margin_start=18,
+                    margin_end=18,
+                )
+            )
 
     def _create_widget(self, item: Message) -> Gtk.Widget:
         row = Gtk.ListBoxRow(activatable=False, child=MessageView(message=item))  # pyright: ignore[reportCallIssue]
-        self._rows[item] = row
+        self._rows[item.unique_id] = row
         return row
 
     def _scroll_to(self, msg: Message, /):
-        if self.message != msg:
+        if self.message is not msg:
+            return
+
+        if not (row := self._rows.get(msg.unique_id)):
             return
 
-        row = self._rows[msg]
         self.viewport.scroll_to(row)
 
         row.add_css_class("selected-message")
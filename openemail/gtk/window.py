@@ -5,9 +5,9 @@
 
 
 from sys import platform
-from typing import Any
+from typing import Any, override
 
-from gi.repository import Adw, Gdk, GObject, Gtk
+from gi.repository import Adw, Gdk, GLib, GObject, Gtk
 
 import openemail as app
 from openemail import APP_ID, PREFIX, Property, store, tasks
@@ -50,6 +50,7 @@ class Window(Adw.ApplicationWindow):
     visible_child_name = Property(str, default="auth")
 
     _quit: bool = False
+    _toast_target: Adw.ToastOverlay | Adw.PreferencesDialog
 
     @Property(str)
     def header_bar_layout(self) -> str:
@@ -77,8 +78,10 @@ class Window(Adw.ApplicationWindow):
         Property.bind(Profile.of(client.user), "image", self, "profile-image")
         Property.bind(app.notifier, "sending", self.sidebar_view, "reveal-bottom-bars")
 
-        Property.bind_setting(store.state_settings, "width", self, "default-width")
-        Property.bind_setting(store.state_settings, "height", self, "default-height")
+        for key in "width", "height":
+            Property.bind_setting(
+                store.state_settings, key, self, f"default-{key}", get_only=True
+            )
         Property.bind_setting(store.state_settings, "show-sidebar", self.split_view)
 
         self.get_settings().connect(
@@ -86,12 +89,28 @@ class Window(Adw.ApplicationWindow):
             lambda *_: self.notify("header-bar-layout"),
         )
 
-        app.notifier.connect("send", self._on_send_notification)
-        tasks.create(store.sync(periodic=True))
+        self._toast_target = self.toast_overlay
+        self.connect("notify::visible-dialog", self._on_visible_dialog_changed)
+        self._notifier_handler = app.notifier.connect(
+            "send", self._on_send_notification
+        )
+
+        GLib.idle_add(
+            tasks.create, store.sync(periodic=True), priority=GLib.PRIORITY_LOW
+        )
 
         if client.user.logged_in:
             self.visible_child_name = "content"
 
+    @override
+    def do_close_request(self) -> bool:
+        width, height = self.get_default_size()
+        store.state_settings.set_int("width", width)
+        store.state_settings.set_int("height", height)
+
+        app.notifier.disconnect(self._notifier_handler)
+        return super().do_close_request()
+
     @Gtk.Template.Callback()
     def _hide_sidebar(self, *_args):
         if self.split_view.props.collapsed:
@@ -101,9 +120,12 @@ class Window(Adw.ApplicationWindow):
     def _on_auth(self, *_args):
         self.visible_child_name = "content"
 
-    def _on_send_notification(self, _obj, toast: Adw.Toast):
-        if isinstance(dialog := self.props.visible_dialog, Adw.PreferencesDialog):
-            dialog.add_toast(toast)
-            return
+    def _on_visible_dialog_changed(self, *_args):
+        self._toast_target = (
+            dialog
+            if isinstance(dialog := self.props.visible_dialog, Adw.PreferencesDialog)
+            else self.toast_overlay
+        )
 
-        self.toast_overlay.add_toast(toast)
+    def _on_send_notification(self, _obj, toast: Adw.Toast):
+        self._toast_target.add_toast(toast)
@@ -7,6 +7,7 @@ from abc import abstractmethod
 from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
 from contextlib import suppress
 from datetime import UTC, datetime
+from functools import cache
 from gettext import ngettext
 from typing import Any, Self, cast, override
 
@@ -257,7 +258,7 @@ class Message(Gio.SimpleActionGroup):
         """Whether the message is unread by the user."""
         from . import store
 
-        return self.unique_id in store.settings.get_strv("unread-messages")
+        return self.unique_id in store.settings_get("unread-messages")
 
     @unread.setter
     def unread(self, unread: bool):
@@ -283,7 +284,7 @@ class Message(Gio.SimpleActionGroup):
 
         return any(
             msg.rsplit(maxsplit=1)[0] == self.unique_id
-            for msg in store.settings.get_strv("trashed-messages")
+            for msg in store.settings_get("trashed-messages")
         )
 
     def __init__(self, msg: model.Message | None = None, /, **kwargs: Any):
@@ -448,7 +449,7 @@ class Message(Gio.SimpleActionGroup):
             "trashed-messages",
             tuple(
                 msg
-                for msg in store.settings.get_strv("trashed-messages")
+                for msg in store.settings_get("trashed-messages")
                 if msg.rsplit(maxsplit=1)[0] != self.unique_id
             ),
         )
@@ -490,10 +491,7 @@ class Message(Gio.SimpleActionGroup):
         ):
             return
 
-        builder = Gtk.Builder.new_from_resource(f"{PREFIX}/dialogs.ui")
-        dialog = cast("Adw.AlertDialog", builder.get_object("discard_dialog"))
-
-        response = await cast("Awaitable[str]", dialog.choose(window))
+        response = await cast("Awaitable[str]", _discard_dialog().choose(window))
         if response != "discard":
             return
 
@@ -605,3 +603,9 @@ async def send(
 
     store.sent.add(msg)
     app.notifier.sending = False
+
+
+@cache
+def _discard_dialog() -> Adw.AlertDialog:
+    builder = Gtk.Builder.new_from_resource(f"{PREFIX}/dialogs.ui")
+    return cast("Adw.AlertDialog", builder.get_object("discard_dialog"))
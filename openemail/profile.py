@@ -3,8 +3,9 @@
 # SPDX-FileCopyrightText: Copyright 2025 OpenEmail SA
 # SPDX-FileContributor: kramo
 
+import asyncio
 from collections.abc import Iterator
-from typing import Any, Self
+from typing import TYPE_CHECKING, Any, Self, cast
 
 from gi.repository import Gdk, GdkPixbuf, Gio, GLib, GObject
 
@@ -15,7 +16,12 @@ from .core import client, contacts, model, profile
 from .core.crypto import KeyPair
 from .core.model import Address, User, WriteError
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+
 MAX_IMAGE_DIMENSIONS = 800
+JPEG_OPTION_KEYS = ("quality",)
+JPEG_OPTION_VALUES = ("80",)
 
 
 class ProfileField(GObject.Object):
@@ -23,12 +29,14 @@ class ProfileField(GObject.Object):
 
     ident = Property(str)
     name = Property(str)
+    icon_name = Property(str)
 
     def __init__(self, ident: str, name: str, **kwargs: Any):
         super().__init__(**kwargs)
 
         self.ident = ident
         self.name = name
+        self.icon_name = f"{ident}-symbolic"
 
 
 class ProfileCategory(GObject.Object, Gio.ListModel):  # pyright: ignore[reportIncompatibleMethodOverride]
@@ -36,6 +44,9 @@ class ProfileCategory(GObject.Object, Gio.ListModel):  # pyright: ignore[reportI
 
     ident = Property(str)
     name = Property(str)
+    icon_name = Property(str)
+
+    fields: tuple[ProfileField, ...]
 
     def __init__(
         self,
@@ -48,14 +59,15 @@ class ProfileCategory(GObject.Object, Gio.ListModel):  # pyright: ignore[reportI
 
         self.ident = ident
         self.name = name
-        self._fields = tuple(ProfileField(K, V) for K, V in fields.items())
+        self.icon_name = f"{ident}-symbolic"
+        self.fields = tuple(ProfileField(K, V) for K, V in fields.items())
 
     def __iter__(self) -> Iterator[ProfileField]:
         return super().__iter__()  # pyright: ignore[reportReturnType]
 
     def do_get_item(self, position: int) -> ProfileField:
         """Get the item at `position`."""
-        return self._fields[position]
+        return self.fields[position]
 
     def do_get_item_type(self) -> type[ProfileField]:
         """Get the type of the items in `self`."""
@@ -63,7 +75,7 @@ class ProfileCategory(GObject.Object, Gio.ListModel):  # pyright: ignore[reportI
 
     def do_get_n_items(self) -> int:
         """Get the number of items in `self`."""
-        return len(self._fields)
+        return len(self.fields)
 
 
 class Profile(GObject.Object):
@@ -143,6 +155,8 @@ class Profile(GObject.Object):
         ),
     )
 
+    fields = tuple(field for category in categories for field in category.fields)
+
     _profile: model.Profile | None = None
     _broadcasts: bool = True
     _address: str | None = None
@@ -300,8 +314,49 @@ async def update(values: dict[str, str]):
     await refresh()
 
 
-async def update_image(pixbuf: GdkPixbuf.Pixbuf):
-    """Upload `pixbuf` to be used as the user's profile image."""
+async def update_image(file: Gio.File):
+    """Upload the image in `file` to be used as the user's profile image."""
+    try:
+        stream = await cast(
+            "Awaitable[Gio.FileInputStream]", file.read_async(GLib.PRIORITY_DEFAULT)
+        )
+        data = await asyncio.get_running_loop().run_in_executor(
+            None, _encode_image, stream
+        )
+    except GLib.Error as error:
+        app.notifier.send(_("Failed to update profile image"))
+        raise WriteError from error
+
+    if not data:
+        app.notifier.send(_("Failed to update profile image"))
+        raise WriteError
+
+    try:
+        await profile.update_image(data)
+    except WriteError:
+        app.notifier.send(_("Failed to update profile image"))
+        raise
+
+    await refresh()
+
+
+async def delete_image():
+    """Delete the user's profile image."""
+    try:
+        await profile.delete_image()
+    except WriteError:
+        app.notifier.send(_("Failed to delete profile image"))
+        raise
+
+    await refresh()
+
+
+def _encode_image(stream: Gio.InputStream) -> bytes | None:
+    try:
+        pixbuf = GdkPixbuf.Pixbuf.new_from_stream(stream, None)
+    finally:
+        stream.close(None)
+
     if (width := pixbuf.props.width) > (height := pixbuf.props.height):
         if width > MAX_IMAGE_DIMENSIONS:
             pixbuf = (
@@ -344,35 +399,10 @@ async def update_image(pixbuf: GdkPixbuf.Pixbuf):
                 width=width,
             )
 
-    try:
-        success, data = pixbuf.save_to_bufferv(
-            type="jpeg",
-            option_keys=("quality",),
-            option_values=("80",),
-        )
-    except GLib.Error as error:
-        app.notifier.send(_("Failed to update profile image"))
-        raise WriteError from error
-
-    if not success:
-        app.notifier.send(_("Failed to update profile image"))
-        raise WriteError
-
-    try:
-        await profile.update_image(data)
-    except WriteError:
-        app.notifier.send(_("Failed to update profile image"))
-        raise
-
-    await refresh()
-
-
-async def delete_image():
-    """Delete the user's profile image."""
-    try:
-        await profile.delete_image()
-    except WriteError:
-        app.notifier.send(_("Failed to delete profile image"))
-        raise
+    success, data = pixbuf.save_to_bufferv(
+        type="jpeg",
+        option_keys=JPEG_OPTION_KEYS,
+        option_values=JPEG_OPTION_VALUES,
+    )
 
-    await refresh()
+    return data if success else None
@@ -3,6 +3,7 @@
 # SPDX-FileCopyrightText: Copyright 2025 OpenEmail SA
 # SPDX-FileContributor: kramo
 
+import asyncio
 import re
 from abc import abstractmethod
 from collections import defaultdict
@@ -14,13 +15,16 @@ from collections.abc import (
     Iterable,
     Iterator,
 )
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import suppress
 from functools import partial
 from itertools import chain
 from pathlib import Path
-from typing import Any
+from typing import Any, override
 
+import keyring
 from gi.repository import Gdk, Gio, GLib, GObject, Gtk
+from keyring.errors import KeyringError, PasswordDeleteError
 
 import openemail as app
 
@@ -39,12 +43,24 @@ settings = Gio.Settings.new(APP_ID)
 state_settings = Gio.Settings.new(f"{APP_ID}.State")
 secret_service = f"{APP_ID}.Keys"
 
+_strv_cache = dict[str, tuple[str, ...]]()
+_secrets = dict[str, str | None]()
+_secret_writes = dict[str, Future[None]]()
+
+# A single worker so that keyring writes and deletions happen in order
+_keyring_executor = ThreadPoolExecutor(max_workers=1)
+
+# Connected before any other handler so they never see stale values
+settings.connect("changed", lambda _settings, key: _strv_cache.pop(key, None))
+
 # TODO: This may not work?
 core.data_dir = Path(GLib.get_user_data_dir(), "openemail")
 core.cache_dir = Path(GLib.get_user_cache_dir(), "openemail")
 
 profiles = defaultdict[Address, Profile](Profile)
 
+_pending_discards = defaultdict[str, set[str]](set)
+
 
 def flatten(*models: GObject.Object) -> Gtk.FlattenListModel:
     """Flatten `models` into a `Gtk.FlattenListModel`.
@@ -68,6 +84,9 @@ class DictStore[K, V](GObject.Object, Gio.ListModel):  # pyright: ignore[reportI
     _item_type: type
     _items: dict[K, V]
 
+    _running_update: asyncio.Task[None] | None = None
+    _next_update: asyncio.Task[None] | None = None
+
     @Property(GObject.Object)
     def item_type(self) -> type:
         """The type of items contained in this dict store.
@@ -88,7 +107,11 @@ class DictStore[K, V](GObject.Object, Gio.ListModel):  # pyright: ignore[reportI
         self.connect("items-changed", lambda *_: self.notify("n-items"))
 
     def __iter__(self) -> Iterator[V]:  # pyright: ignore[reportIncompatibleMethodOverride]
-        return super().__iter__()  # pyright: ignore[reportReturnType]
+        # Snapshot so `self` can be modified while iterating
+        return iter(tuple(self._items.values()))
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._items
 
     def do_get_item(self, position: int) -> V | None:
         """Get the item at `position`.
@@ -109,10 +132,33 @@ class DictStore[K, V](GObject.Object, Gio.ListModel):  # pyright: ignore[reportI
         return len(self._items)
 
     async def update(self):
-        """Update `self` asynchronously."""
+        """Update `self` asynchronously.
+
+        If an update is already running, a single follow-up update is started
+        once it finishes, which all callers in the meantime wait for.
+        """
+        if not (running := self._running_update):
+            task = self._running_update = asyncio.create_task(self._run_update())
+        elif not (task := self._next_update):
+            task = self._next_update = asyncio.create_task(self._run_update(running))
+
+        await asyncio.shield(task)
+
+    async def _run_update(self, previous: asyncio.Task[None] | None = None):
+        if previous:
+            with suppress(Exception):
+                await previous
+
+            self._running_update, self._next_update = self._next_update, None
+
         self.updating = True
-        await self._update()
-        self.updating = False
+        try:
+            await self._update()
+        finally:
+            # A waiting follow-up takes over as the running update
+            if self._running_update is asyncio.current_task() and not self._next_update:
+                self._running_update = None
+                self.updating = False
 
     def add(self, item: Any) -> V:  # noqa: ANN401
         """Manually add `item` to `self`.
@@ -205,16 +251,15 @@ class _AddressBook(ProfileStore):
         """Add `address` to the user's address book."""
         self.add(address).contact_request = False
 
-        tasks.create(self.update_profiles())
-        tasks.create(broadcasts.update())
-        tasks.create(inbox.update())
+        tasks.create(
+            _gather(self.update_profiles(), broadcasts.update(), inbox.update())
+        )
 
         try:
             await contacts.new(address, receive_broadcasts=receive_broadcasts)
         except WriteError:
             self.remove(address)
-            tasks.create(broadcasts.update())
-            tasks.create(inbox.update())
+            tasks.create(_gather(broadcasts.update(), inbox.update()))
 
             app.notifier.send(_("Failed to add contact"))
             raise
@@ -222,15 +267,13 @@ class _AddressBook(ProfileStore):
     async def delete(self, address: Address):
         """Delete `address` from the user's address book."""
         self.remove(address)
-        tasks.create(broadcasts.update())
-        tasks.create(inbox.update())
+        tasks.create(_gather(broadcasts.update(), inbox.update()))
 
         try:
             await contacts.delete(address)
         except WriteError:
             self.add(address)
-            tasks.create(broadcasts.update())
-            tasks.create(inbox.update())
+            tasks.create(_gather(broadcasts.update(), inbox.update()))
 
             app.notifier.send(_("Failed to remove contact"))
             raise
@@ -253,7 +296,7 @@ address_book = _AddressBook()
 
 class _ContactRequests(ProfileStore):
     async def _update(self):
-        for request in (requests := settings.get_strv("contact-requests")):
+        for request in (requests := settings_get("contact-requests")):
             try:
                 address = Address(request)
             except ValueError:
@@ -296,11 +339,46 @@ class MessageStore(DictStore[str, Message]):
     default_factory = Message
 
     _item_type = Message
+    _threads: defaultdict[str, set[str]]
+
+    def __init__(self, **kwargs: Any):
+        super().__init__(**kwargs)
+
+        self._threads = defaultdict(set)
 
     def get(self, ident: str) -> Message | None:
         """Get the message with `ident` or `None` if it is not in `self`."""
         return self._items.get(ident)
 
+    def thread(self, subject_id: str) -> tuple[Message, ...]:
+        """Get the messages in `self` that are part of the thread `subject_id`."""
+        return tuple(
+            msg
+            for ident in self._threads.get(subject_id, ())
+            if (msg := self._items.get(ident))
+        )
+
+    @override
+    def add(self, item: model.Message) -> Message:
+        # Index before `items-changed` is emitted so handlers can already use it
+        match item:
+            case model.IncomingMessage() | model.OutgoingMessage() if item.subject_id:
+                self._threads[item.subject_id].add(self.__class__.key_for(item))
+
+        return super().add(item)
+
+    @override
+    def remove(self, item: str):
+        if (msg := self._items.get(item)) and msg.subject_id:
+            self._threads[msg.subject_id].discard(item)
+
+        super().remove(item)
+
+    @override
+    def clear(self):
+        self._threads.clear()
+        super().clear()
+
     async def _update(self):
         idents = set[str]()
 
@@ -319,7 +397,7 @@ class MessageStore(DictStore[str, Message]):
     ) -> AsyncGenerator[model.Message]:
         unread = set[str]()
         async for msgs in futures:
-            current_unread = settings.get_strv("unread-messages")
+            current_unread = settings_get("unread-messages")
 
             for msg in msgs:
                 key = MessageStore.key_for(msg)
@@ -363,7 +441,7 @@ class _InboxStore(MessageStore):
                 known_notifiers.add(notifier)
                 continue
 
-            if notifier.host_part in settings.get_strv("trusted-domains"):
+            if notifier.host_part in settings_get("trusted-domains"):
                 await address_book.new(notifier)
                 known_notifiers.add(notifier)
                 continue
@@ -397,7 +475,7 @@ sent = _SentStore()
 
 
 class _OutboxStore(MessageStore):
-    filter = Gtk.CustomFilter.new(lambda msg: msg.unique_id not in outbox._items)
+    filter = Gtk.CustomFilter.new(lambda msg: msg.unique_id not in outbox)
     default_factory = partial(
         Message,
         can_discard=True,
@@ -530,21 +608,87 @@ async def sync(*, periodic: bool = False):
     )
 
 
+def thread(subject_id: str) -> tuple[Message, ...]:
+    """Get all messages that are part of the thread `subject_id`."""
+    return (
+        *inbox.thread(subject_id),
+        *outbox.thread(subject_id),
+        *broadcasts.thread(subject_id),
+        *(msg for msg in sent.thread(subject_id) if msg.unique_id not in outbox),
+    )
+
+
 def empty_trash():
     """Empty the user's trash."""
     for msg in tuple(m for m in chain(inbox, broadcasts, sent) if m.trashed):
         msg.delete()
 
 
+def secret_get(address: str) -> str | None:
+    """Get the keys stored in the keyring for `address`.
+
+    The keyring is only read the first time, then the value is kept in memory.
+    """
+    if address not in _secrets:
+        _secrets[address] = keyring.get_password(secret_service, address)
+
+    return _secrets[address]
+
+
+def secret_set(address: str, keys: str):
+    """Store `keys` in the keyring for `address`.
+
+    The value in memory is updated right away, while the keyring is written to
+    in a worker thread, only if the value changed.
+    """
+    if _secrets.get(address) == keys:
+        return
+
+    _secrets[address] = keys
+
+    if previous := _secret_writes.get(address):
+        previous.cancel()
+
+    write = _secret_writes[address] = _keyring_executor.submit(
+        keyring.set_password, secret_service, address, keys
+    )
+    tasks.create(_finish_secret_write(address, keys, write))
+
+
+def secret_delete(address: str):
+    """Delete the keys stored in the keyring for `address`.
+
+    Pending writes for `address` are either cancelled or finish before.
+    """
+    _secrets.pop(address, None)
+
+    if write := _secret_writes.pop(address, None):
+        write.cancel()
+
+    delete = _keyring_executor.submit(_delete_secret, address)
+    tasks.create(_finish_secret_delete(delete))
+
+
+def settings_get(key: str) -> tuple[str, ...]:
+    """Get the value of a strv settings `key`.
+
+    The value is cached in memory until the key changes.
+    """
+    if (value := _strv_cache.get(key)) is None:
+        value = _strv_cache[key] = tuple(settings.get_strv(key))
+
+    return value
+
+
 def settings_add(key: str, *items: str):
     """Add `items` to a strv settings `key`."""
-    value = settings.get_strv(key)
+    value = settings_get(key)
     settings.set_strv(key, (*value, *(i for i in items if i not in value)))
 
 
 def settings_discard(key: str, *items: str):
     """Discard `items` from a strv settings `key`."""
-    value = settings.get_strv(key)
+    value = list(settings_get(key))
     for item in items:
         with suppress(ValueError):
             value.remove(item)
@@ -552,9 +696,59 @@ def settings_discard(key: str, *items: str):
     settings.set_strv(key, value)
 
 
+def settings_discard_batched(key: str, *items: str):
+    """Discard `items` from a strv settings `key` shortly after.
+
+    Items passed in quick succession are all discarded in a single write.
+    """
+    if not _pending_discards:
+        GLib.timeout_add(50, _flush_discards)
+
+    _pending_discards[key].update(items)
+
+
+def _flush_discards() -> bool:
+    for key, items in _pending_discards.items():
+        settings_discard(key, *items)
+
+    _pending_discards.clear()
+    return GLib.SOURCE_REMOVE
+
+
+async def _gather(*coros: Coroutine[Any, Any, Any]):
+    await asyncio.gather(*coros)
+
+
+async def _finish_secret_write(address: str, keys: str, write: Future[None]):
+    try:
+        await asyncio.wrap_future(write)
+    except asyncio.CancelledError:
+        return
+    except KeyringError:
+        if _secrets.get(address) == keys:
+            del _secrets[address]
+
+        app.notifier.send(_("Failed to save keys to the keyring"))
+    finally:
+        if _secret_writes.get(address) is write:
+            del _secret_writes[address]
+
+
+async def _finish_secret_delete(delete: Future[None]):
+    try:
+        await asyncio.wrap_future(delete)
+    except KeyringError:
+        app.notifier.send(_("Failed to remove keys from the keyring"))
+
+
+def _delete_secret(address: str):
+    with suppress(PasswordDeleteError):
+        keyring.delete_password(secret_service, address)
+
+
 def _exclude(address: Address) -> tuple[str, ...]:
     return tuple(
         split[1]
-        for ident in settings.get_strv("deleted-messages")
+        for ident in settings_get("deleted-messages")
         if (split := ident.split(" "))[0] == address.host_part
     )